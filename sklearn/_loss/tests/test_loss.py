@@ -76,7 +76,7 @@ def random_y_true_raw_prediction(
             high=raw_bound[1],
             size=n_samples * loss.n_classes,
         )
-        y_true = np.arange(n_samples).astype(float) % loss.n_classes
+        y_true = np.arange(n_samples, dtype=float) % loss.n_classes
     else:
         # If link is identity, we must respect the interval of y_pred:
         if isinstance(loss.link, IdentityLink):
@@ -107,12 +107,16 @@ def numerical_derivative(func, x, eps):
     # https://en.wikipedia.org/wiki/Numerical_differentiation
     # https://en.wikipedia.org/wiki/Finite_difference_coefficient
     # We use central finite differences of accuracy 4.
-    h = np.full_like(x, fill_value=eps)
-    f_minus_2h = func(x - 2 * h)
-    f_minus_1h = func(x - h)
-    f_plus_1h = func(x + h)
-    f_plus_2h = func(x + 2 * h)
-    return (-f_plus_2h + 8 * f_plus_1h - 8 * f_minus_1h + f_minus_2h) / (12.0 * eps)
+    f_minus_2h = func(x - 2 * eps)
+    f_minus_1h = func(x - eps)
+    f_plus_1h = func(x + eps)
+    f_plus_2h = func(x + 2 * eps)
+    # Accumulate into one buffer instead of materializing each term of the
+    # stencil separately.
+    out = f_minus_2h - f_plus_2h
+    out += 8.0 * (f_plus_1h - f_minus_1h)
+    out /= 12.0 * eps
+    return out
 
 
 @pytest.mark.parametrize("loss", LOSS_INSTANCES, ids=loss_instance_name)
@@ -650,7 +654,7 @@ def test_loss_of_perfect_prediction(loss, sample_weight):
         y_true = loss.link.inverse(raw_prediction)
     else:
         # HalfMultinomialLoss
-        y_true = np.arange(loss.n_classes).astype(float)
+        y_true = np.arange(loss.n_classes, dtype=float)
         # raw_prediction with entries -exp(10), but +exp(10) on the diagonal
         # this is close enough to np.inf which would produce nan
         raw_prediction = np.full(
@@ -737,9 +741,12 @@ def test_gradients_hessians_numerically(loss, sample_weight, global_random_seed)
         # As a softmax is computed, offsetting the whole array by a constant
         # would have no effect on the probabilities, and thus on the loss.
         for k in range(loss.n_classes):
+            # Copy once per class; the closures below only ever overwrite
+            # column k before evaluating, so the buffer can be shared between
+            # the stencil evaluations.
+            raw = raw_prediction.copy()
 
             def loss_func(x):
-                raw = raw_prediction.copy()
                 raw[:, k] = x
                 return loss.loss(
                     y_true=y_true,
@@ -751,7 +758,6 @@ def test_gradients_hessians_numerically(loss, sample_weight, global_random_seed)
             assert_allclose(g[:, k], g_numeric, rtol=5e-6, atol=1e-10)
 
             def grad_func(x):
-                raw = raw_prediction.copy()
                 raw[:, k] = x
                 return loss.gradient(
                     y_true=y_true,
@@ -807,11 +813,23 @@ def test_derivatives(loss, x0, y_true):
             y_true=y_true, raw_prediction=x
         ) + loss.constant_to_optimal_zero(y_true=y_true)
 
+    # newton evaluates fprime and fprime2 at the same point in each
+    # iteration; compute the (gradient, hessian) pair once per point.
+    gradient_hessian_memo = {}
+
+    def gradient_hessian(x: np.ndarray) -> tuple:
+        key = x.item()
+        if key not in gradient_hessian_memo:
+            gradient_hessian_memo[key] = loss.gradient_hessian(
+                y_true=y_true, raw_prediction=x
+            )
+        return gradient_hessian_memo[key]
+
     def fprime(x: np.ndarray) -> np.ndarray:
-        return loss.gradient(y_true=y_true, raw_prediction=x)
+        return gradient_hessian(x)[0]
 
     def fprime2(x: np.ndarray) -> np.ndarray:
-        return loss.gradient_hessian(y_true=y_true, raw_prediction=x)[1]
+        return gradient_hessian(x)[1]
 
     optimum = newton(
         func,
@@ -842,7 +860,7 @@ def test_loss_intercept_only(loss, sample_weight):
     if not loss.is_multiclass:
         y_true = loss.link.inverse(np.linspace(-4, 4, num=n_samples))
     else:
-        y_true = np.arange(n_samples).astype(np.float64) % loss.n_classes
+        y_true = np.arange(n_samples, dtype=np.float64) % loss.n_classes
         y_true[::5] = 0  # exceedance of class 0
 
     if sample_weight == "range":
@@ -957,8 +975,8 @@ def test_multinomial_loss_fit_intercept_only():
     assert_allclose(baseline_prediction, np.log(p) - np.mean(np.log(p)))
     assert_allclose(baseline_prediction[None, :], loss.link.link(p[None, :]))
 
+    # np.zeros/np.ones already yield float64; no astype round-trip needed
     for y_train in (np.zeros(shape=10), np.ones(shape=10)):
-        y_train = y_train.astype(np.float64)
         baseline_prediction = loss.fit_intercept_only(y_true=y_train)
         assert baseline_prediction.dtype == y_train.dtype
         assert_all_finite(baseline_prediction)
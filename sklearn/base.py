@@ -113,17 +113,18 @@ def _clone_parametrized(estimator, *, safe=True):
     except AttributeError:
         pass
 
-    params_set = new_object.get_params(deep=False)
-
-    # quick sanity check of the parameters of the clone
-    for name in new_object_params:
-        param1 = new_object_params[name]
-        param2 = params_set[name]
-        if param1 is not param2:
-            raise RuntimeError(
-                "Cannot clone object %s, as the constructor "
-                "either does not set or modifies parameter %s" % (estimator, name)
-            )
+    if new_object_params:
+        params_set = new_object.get_params(deep=False)
+
+        # quick sanity check of the parameters of the clone
+        for name in new_object_params:
+            param1 = new_object_params[name]
+            param2 = params_set[name]
+            if param1 is not param2:
+                raise RuntimeError(
+                    "Cannot clone object %s, as the constructor "
+                    "either does not set or modifies parameter %s" % (estimator, name)
+                )
 
     # _sklearn_output_config is used by `set_output` to configure the output
     # container of an estimator.
@@ -147,6 +148,14 @@ class BaseEstimator(_HTMLDocumentationLinkMixin, _MetadataRequester):
     @classmethod
     def _get_param_names(cls):
         """Get parameter names for the estimator"""
+        # The signature inspection below is comparatively costly and its
+        # result only depends on the class, so cache it. Look the cache up
+        # through `__dict__` so a subclass does not inherit the names cached
+        # for its parent.
+        cached = cls.__dict__.get("_param_names_cache")
+        if cached is not None:
+            return cached
+
         # fetch the constructor or the original constructor before
         # deprecation wrapping if any
         init = getattr(cls.__init__, "deprecated_original", cls.__init__)
@@ -173,7 +182,9 @@ class BaseEstimator(_HTMLDocumentationLinkMixin, _MetadataRequester):
                     " follow this convention." % (cls, init_signature)
                 )
         # Extract and sort argument names excluding 'self'
-        return sorted([p.name for p in parameters])
+        param_names = sorted([p.name for p in parameters])
+        cls._param_names_cache = param_names
+        return param_names
 
     def get_params(self, deep=True):
         """
@@ -195,7 +206,7 @@ class BaseEstimator(_HTMLDocumentationLinkMixin, _MetadataRequester):
             value = getattr(self, key)
             if deep and hasattr(value, "get_params") and not isinstance(value, type):
                 deep_items = value.get_params().items()
-                out.update((key + "__" + k, val) for k, val in deep_items)
+                out.update((f"{key}__{k}", val) for k, val in deep_items)
             out[key] = value
         return out
 
@@ -759,16 +759,33 @@ class ColumnTransformer(TransformerMixin, _BaseComposition):
             )
         )
         try:
+            # Build the passthrough prototype once; the job-building loop below
+            # clones it for each "passthrough" entry, so sharing a prototype is
+            # equivalent to constructing a new instance per transformer.
+            passthrough_trans = None
             jobs = []
             for idx, (name, trans, column, weight) in enumerate(transformers, start=1):
+                if (isinstance(column, np.ndarray) and column.dtype.kind == "b") or (
+                    isinstance(column, list)
+                    and column
+                    and isinstance(column[0], (bool, np.bool_))
+                ):
+                    # Boolean masks were resolved to integer positions in
+                    # `_validate_column_callables`; index with those instead of
+                    # re-applying the mask on every fit/transform call. Note
+                    # that `transformers_` keeps the mask as provided by the
+                    # user, only the indexing below uses the cached positions.
+                    column = self._transformer_to_input_indices[name]
                 if func is _fit_transform_one:
                     if trans == "passthrough":
-                        output_config = _get_output_config("transform", self)
-                        trans = FunctionTransformer(
-                            accept_sparse=True,
-                            check_inverse=False,
-                            feature_names_out="one-to-one",
-                        ).set_output(transform=output_config["dense"])
+                        if passthrough_trans is None:
+                            output_config = _get_output_config("transform", self)
+                            passthrough_trans = FunctionTransformer(
+                                accept_sparse=True,
+                                check_inverse=False,
+                                feature_names_out="one-to-one",
+                            ).set_output(transform=output_config["dense"])
+                        trans = passthrough_trans
 
                     extra_args = dict(
                         message_clsname="ColumnTransformer",
@@ -963,7 +980,9 @@ class ColumnTransformer(TransformerMixin, _BaseComposition):
             ]
 
             all_indices = set(chain(*non_dropped_indices))
-            all_names = set(self.feature_names_in_[ind] for ind in all_indices)
+            # Gather the fitted column names in one fancy-indexing call rather
+            # than one `feature_names_in_[ind]` scalar lookup per column.
+            all_names = set(self.feature_names_in_[list(all_indices)])
 
             diff = all_names - set(column_names)
             if diff:
@@ -1018,7 +1037,7 @@ class ColumnTransformer(TransformerMixin, _BaseComposition):
                     "be a numeric or convertible to a numeric."
                 ) from e
 
-            return sparse.hstack(converted_Xs).tocsr()
+            return sparse.hstack(converted_Xs, format="csr")
         else:
             Xs = [f.toarray() if sparse.issparse(f) else f for f in Xs]
             adapter = _get_container_adapter("transform", self)
@@ -1058,6 +1077,22 @@ class ColumnTransformer(TransformerMixin, _BaseComposition):
                 )
                 return adapter.rename_columns(output, names_out)
 
+            if (
+                len(Xs) == 1
+                and isinstance(Xs[0], np.ndarray)
+                and Xs[0].flags.owndata
+                and Xs[0].flags.writeable
+            ):
+                # A single ndarray block owning its memory: np.hstack would
+                # only copy it. Blocks that are views (e.g. a passthrough
+                # transformer on a slice of the input) still go through
+                # np.hstack below so that the output never aliases the
+                # caller's data and is always writeable.
+                return Xs[0]
+            if all(isinstance(X, np.ndarray) for X in Xs):
+                # the blocks are validated to be 2-D, so concatenate directly
+                # and skip np.hstack's per-block atleast_1d wrapping
+                return np.concatenate(Xs, axis=1)
             return np.hstack(Xs)
 
     def _sk_visual_block_(self):
@@ -161,7 +161,7 @@ class TransformedTargetRegressor(
         """Check transformer and fit transformer.
 
         Create the default transformer, fit it and make additional inverse
-        check on a subset (optional).
+        check on a subset (optional). Return the transformed target.
 
         """
         if self.transformer is not None and (
@@ -187,11 +187,22 @@ class TransformedTargetRegressor(
         # transformer. However, if transformer starts using sample_weight, the
         # code should be modified accordingly. At the time to consider the
         # sample_prop feature, it is also a good use case to be considered.
-        self.transformer_.fit(y)
-        if self.check_inverse:
+        if hasattr(self.transformer_, "fit_transform"):
+            y_trans = self.transformer_.fit_transform(y)
+        else:
+            y_trans = self.transformer_.fit(y).transform(y)
+        # the default identity transformer round-trips exactly, no need to
+        # check it
+        is_identity = (
+            self.transformer is None and self.func is None and self.inverse_func is None
+        )
+        if self.check_inverse and not is_identity:
             idx_selected = slice(None, None, max(1, y.shape[0] // 10))
-            y_sel = _safe_indexing(y, idx_selected)
-            y_sel_t = self.transformer_.transform(y_sel)
+            # y went through check_array and is guaranteed to be an ndarray;
+            # y_trans may be a container (e.g. with `set_output`) and needs
+            # the generic indexing dispatch.
+            y_sel = y[idx_selected]
+            y_sel_t = _safe_indexing(y_trans, idx_selected)
             if not np.allclose(y_sel, self.transformer_.inverse_transform(y_sel_t)):
                 warnings.warn(
                     (
@@ -202,6 +213,7 @@ class TransformedTargetRegressor(
                     ),
                     UserWarning,
                 )
+        return y_trans
 
     @_fit_context(
         # TransformedTargetRegressor.regressor/transformer are not validated yet.
@@ -251,13 +263,12 @@ class TransformedTargetRegressor(
         # transformers are designed to modify X which is 2d dimensional, we
         # need to modify y accordingly.
         if y.ndim == 1:
-            y_2d = y.reshape(-1, 1)
+            y_2d = y[:, np.newaxis]
         else:
             y_2d = y
-        self._fit_transformer(y_2d)
-
-        # transform y and convert back to 1d array if needed
-        y_trans = self.transformer_.transform(y_2d)
+        # fit and transform y in one go, then convert back to 1d array if
+        # needed
+        y_trans = self._fit_transformer(y_2d)
         # FIXME: a FunctionTransformer can return a 1D array even when validate
         # is set to True. Therefore, we need to check the number of dimension
         # first.
@@ -36,6 +36,12 @@ from sklearn.utils._testing import (
 )
 from sklearn.utils.fixes import CSR_CONTAINERS
 
+try:
+    import pandas as pd
+except ImportError:
+    # tests relying on pandas are skipped through `pytest.importorskip`
+    pd = None
+
 
 class Trans(TransformerMixin, BaseEstimator):
     def fit(self, X, y=None):
@@ -68,7 +74,7 @@ class SparseMatrixTrans(BaseEstimator):
 
     def transform(self, X, y=None):
         n_samples = len(X)
-        return self.csr_container(sparse.eye(n_samples, n_samples))
+        return self.csr_container(sparse.eye(n_samples, n_samples, format="csr"))
 
 
 class TransNo2D(BaseEstimator):
@@ -87,42 +93,56 @@ class TransRaise(BaseEstimator):
         raise ValueError("specific message")
 
 
-def test_column_transformer():
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+# Shared (3, 2) input used across many tests below. It is built once and made
+# read-only so tests can alias it without re-allocating or mutating it.
+X_ARRAY = np.ascontiguousarray(np.array([[0, 1, 2], [2, 4, 6]]).T)
+X_ARRAY.flags.writeable = False
 
-    X_res_first1D = np.array([0, 1, 2])
-    X_res_second1D = np.array([2, 4, 6])
-    X_res_first = X_res_first1D.reshape(-1, 1)
-    X_res_both = X_array
+# Expected output for a transformer_weights={...: 0.1} applied to X_ARRAY,
+# precomputed once instead of rebuilding the scaled copy in every assertion.
+X_ARRAY_SCALED_01 = 0.1 * X_ARRAY
+X_ARRAY_SCALED_01.flags.writeable = False
 
-    cases = [
+
+@pytest.mark.parametrize(
+    "selection, res",
+    [
         # single column 1D / 2D
-        (0, X_res_first),
-        ([0], X_res_first),
+        (0, "first"),
+        ([0], "first"),
         # list-like
-        ([0, 1], X_res_both),
-        (np.array([0, 1]), X_res_both),
+        ([0, 1], "both"),
+        (np.array([0, 1]), "both"),
         # slice
-        (slice(0, 1), X_res_first),
-        (slice(0, 2), X_res_both),
+        (slice(0, 1), "first"),
+        (slice(0, 2), "both"),
         # boolean mask
-        (np.array([True, False]), X_res_first),
-        ([True, False], X_res_first),
-        (np.array([True, True]), X_res_both),
-        ([True, True], X_res_both),
-    ]
+        (np.array([True, False]), "first"),
+        ([True, False], "first"),
+        (np.array([True, True]), "both"),
+        ([True, True], "both"),
+    ],
+)
+def test_column_transformer(selection, res):
+    X_array = X_ARRAY
+    res = X_array[:, [0]] if res == "first" else X_array
 
-    for selection, res in cases:
-        ct = ColumnTransformer([("trans", Trans(), selection)], remainder="drop")
-        assert_array_equal(ct.fit_transform(X_array), res)
-        assert_array_equal(ct.fit(X_array).transform(X_array), res)
+    ct = ColumnTransformer([("trans", Trans(), selection)], remainder="drop")
+    assert_array_equal(ct.fit_transform(X_array), res)
+    assert_array_equal(ct.fit(X_array).transform(X_array), res)
 
-        # callable that returns any of the allowed specifiers
-        ct = ColumnTransformer(
-            [("trans", Trans(), lambda x: selection)], remainder="drop"
-        )
-        assert_array_equal(ct.fit_transform(X_array), res)
-        assert_array_equal(ct.fit(X_array).transform(X_array), res)
+    # callable that returns any of the allowed specifiers
+    ct = ColumnTransformer([("trans", Trans(), lambda x: selection)], remainder="drop")
+    assert_array_equal(ct.fit_transform(X_array), res)
+    assert_array_equal(ct.fit(X_array).transform(X_array), res)
+
+
+def test_column_transformer_transformer_weights():
+    X_array = X_ARRAY
+
+    X_res_first1D = np.array([0, 1, 2])
+    X_res_second1D = np.array([2, 4, 6])
+    X_res_both = X_array
 
     ct = ColumnTransformer([("trans1", Trans(), [0]), ("trans2", Trans(), [1])])
     assert_array_equal(ct.fit_transform(X_array), X_res_both)
@@ -135,12 +155,12 @@ def test_column_transformer():
         [("trans1", Trans(), [0]), ("trans2", Trans(), [1])],
         transformer_weights=transformer_weights,
     )
-    res = np.vstack(
+    res = np.column_stack(
         [
             transformer_weights["trans1"] * X_res_first1D,
             transformer_weights["trans2"] * X_res_second1D,
         ]
-    ).T
+    )
     assert_array_equal(both.fit_transform(X_array), res)
     assert_array_equal(both.fit(X_array).transform(X_array), res)
     assert len(both.transformers_) == 2
@@ -148,13 +168,13 @@ def test_column_transformer():
     both = ColumnTransformer(
         [("trans", Trans(), [0, 1])], transformer_weights={"trans": 0.1}
     )
-    assert_array_equal(both.fit_transform(X_array), 0.1 * X_res_both)
-    assert_array_equal(both.fit(X_array).transform(X_array), 0.1 * X_res_both)
+    assert_array_equal(both.fit_transform(X_array), X_ARRAY_SCALED_01)
+    assert_array_equal(both.fit(X_array).transform(X_array), X_ARRAY_SCALED_01)
     assert len(both.transformers_) == 1
 
 
 def test_column_transformer_tuple_transformers_parameter():
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
 
     transformers = [("trans1", Trans(), [0]), ("trans2", Trans(), [1])]
 
@@ -177,7 +197,7 @@ def test_column_transformer_dataframe(constructor_name):
     else:
         dataframe_lib = pytest.importorskip(constructor_name)
 
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_df = _convert_container(
         X_array, constructor_name, columns_name=["first", "second"]
     )
@@ -250,12 +270,12 @@ def test_column_transformer_dataframe(constructor_name):
         [("trans1", Trans(), ["first"]), ("trans2", Trans(), ["second"])],
         transformer_weights=transformer_weights,
     )
-    res = np.vstack(
+    res = np.column_stack(
         [
             transformer_weights["trans1"] * X_df["first"],
             transformer_weights["trans2"] * X_df["second"],
         ]
-    ).T
+    )
     assert_array_equal(both.fit_transform(X_df), res)
     assert_array_equal(both.fit(X_df).transform(X_df), res)
     assert len(both.transformers_) == 2
@@ -265,16 +285,16 @@ def test_column_transformer_dataframe(constructor_name):
     both = ColumnTransformer(
         [("trans", Trans(), ["first", "second"])], transformer_weights={"trans": 0.1}
     )
-    assert_array_equal(both.fit_transform(X_df), 0.1 * X_res_both)
-    assert_array_equal(both.fit(X_df).transform(X_df), 0.1 * X_res_both)
+    assert_array_equal(both.fit_transform(X_df), X_ARRAY_SCALED_01)
+    assert_array_equal(both.fit(X_df).transform(X_df), X_ARRAY_SCALED_01)
     assert len(both.transformers_) == 1
     assert both.transformers_[-1][0] != "remainder"
 
     both = ColumnTransformer(
         [("trans", Trans(), [0, 1])], transformer_weights={"trans": 0.1}
     )
-    assert_array_equal(both.fit_transform(X_df), 0.1 * X_res_both)
-    assert_array_equal(both.fit(X_df).transform(X_df), 0.1 * X_res_both)
+    assert_array_equal(both.fit_transform(X_df), X_ARRAY_SCALED_01)
+    assert_array_equal(both.fit(X_df).transform(X_df), X_ARRAY_SCALED_01)
     assert len(both.transformers_) == 1
     assert both.transformers_[-1][0] != "remainder"
 
@@ -344,12 +364,12 @@ def test_column_transformer_dataframe(constructor_name):
 def test_column_transformer_empty_columns(pandas, column_selection, callable_column):
     # test case that ensures that the column transformer does also work when
     # a given transformer doesn't have any columns to work on
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_res_both = X_array
 
     if pandas:
         pd = pytest.importorskip("pandas")
-        X = pd.DataFrame(X_array, columns=["first", "second"])
+        X = pd.DataFrame({"first": X_array[:, 0], "second": X_array[:, 1]})
     else:
         X = X_array
 
@@ -466,8 +486,10 @@ def test_column_transformer_output_indices_df():
 def test_column_transformer_sparse_array(csr_container):
     X_sparse = csr_container(sparse.eye(3, 2))
 
-    # no distinction between 1D and 2D
-    X_res_first = X_sparse[:, [0]]
+    # no distinction between 1D and 2D. Take the reference column from a CSC
+    # copy: column slicing is O(1) on the indptr there, while slicing the CSR
+    # input directly goes through scipy's slow row-wise path.
+    X_res_first = X_sparse.tocsc()[:, [0]]
     X_res_both = X_sparse
 
     for col in [(0,), [0], slice(0, 1)]:
@@ -508,7 +530,7 @@ def test_column_transformer_list():
 
 @pytest.mark.parametrize("csr_container", CSR_CONTAINERS)
 def test_column_transformer_sparse_stacking(csr_container):
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     col_trans = ColumnTransformer(
         [("trans1", Trans(), [0]), ("trans2", SparseMatrixTrans(csr_container), 1)],
         sparse_threshold=0.8,
@@ -624,7 +646,7 @@ def test_column_transformer_error_msg_1D():
 
 
 def test_2D_transformer_output():
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
 
     # if one transformer is dropped, test that name is still correct
     ct = ColumnTransformer([("trans1", "drop", 0), ("trans2", TransNo2D(), 1)])
@@ -640,7 +662,7 @@ def test_2D_transformer_output():
 def test_2D_transformer_output_pandas():
     pd = pytest.importorskip("pandas")
 
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_df = pd.DataFrame(X_array, columns=["col1", "col2"])
 
     # if one transformer is dropped, test that name is still correct
@@ -654,20 +676,29 @@ def test_2D_transformer_output_pandas():
 
 
 @pytest.mark.parametrize("remainder", ["drop", "passthrough"])
-def test_column_transformer_invalid_columns(remainder):
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+@pytest.mark.parametrize(
+    "col, match",
+    [
+        # general invalid
+        (1.5, "No valid specification"),
+        (["string", 1], "No valid specification"),
+        (slice(1, "s"), "No valid specification"),
+        (np.array([1.0]), "No valid specification"),
+        # invalid for arrays
+        ("string", "Specifying the columns"),
+        (["string", "other"], "Specifying the columns"),
+        (slice("a", "b"), "Specifying the columns"),
+    ],
+)
+def test_column_transformer_invalid_columns(remainder, col, match):
+    ct = ColumnTransformer([("trans", Trans(), col)], remainder=remainder)
+    with pytest.raises(ValueError, match=match):
+        ct.fit(X_ARRAY)
 
-    # general invalid
-    for col in [1.5, ["string", 1], slice(1, "s"), np.array([1.0])]:
-        ct = ColumnTransformer([("trans", Trans(), col)], remainder=remainder)
-        with pytest.raises(ValueError, match="No valid specification"):
-            ct.fit(X_array)
 
-    # invalid for arrays
-    for col in ["string", ["string", "other"], slice("a", "b")]:
-        ct = ColumnTransformer([("trans", Trans(), col)], remainder=remainder)
-        with pytest.raises(ValueError, match="Specifying the columns"):
-            ct.fit(X_array)
+@pytest.mark.parametrize("remainder", ["drop", "passthrough"])
+def test_column_transformer_n_features_mismatch(remainder):
+    X_array = X_ARRAY
 
     # transformed n_features does not match fitted n_features
     col = [0, 1]
@@ -697,7 +728,7 @@ def test_column_transformer_invalid_transformer():
         def predict(self, X):
             return X
 
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     ct = ColumnTransformer([("trans", NoTrans(), [0])])
     msg = "All estimators should implement fit and transform"
     with pytest.raises(TypeError, match=msg):
@@ -716,8 +747,8 @@ def test_make_column_transformer():
 
 def test_make_column_transformer_pandas():
     pd = pytest.importorskip("pandas")
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
-    X_df = pd.DataFrame(X_array, columns=["first", "second"])
+    X_array = X_ARRAY
+    X_df = pd.DataFrame({"first": X_array[:, 0], "second": X_array[:, 1]})
     norm = Normalizer()
     ct1 = ColumnTransformer([("norm", Normalizer(), X_df.columns)])
     ct2 = make_column_transformer((norm, X_df.columns))
@@ -888,7 +919,7 @@ def test_column_transformer_special_strings():
 
 
 def test_column_transformer_remainder():
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
 
     X_res_first = np.array([0, 1, 2]).reshape(-1, 1)
     X_res_second = np.array([2, 4, 6]).reshape(-1, 1)
@@ -940,7 +971,7 @@ def test_column_transformer_remainder():
 )
 def test_column_transformer_remainder_numpy(key):
     # test different ways that columns are specified with passthrough
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_res_both = X_array
 
     ct = ColumnTransformer([("trans1", Trans(), key)], remainder="passthrough")
@@ -972,8 +1003,8 @@ def test_column_transformer_remainder_pandas(key):
     if isinstance(key, str) and key == "pd-index":
         key = pd.Index(["first"])
 
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
-    X_df = pd.DataFrame(X_array, columns=["first", "second"])
+    X_array = X_ARRAY
+    X_df = pd.DataFrame({"first": X_array[:, 0], "second": X_array[:, 1]})
     X_res_both = X_array
 
     ct = ColumnTransformer([("trans1", Trans(), key)], remainder="passthrough")
@@ -1224,7 +1255,7 @@ def test_column_transformer_no_estimators_set_params():
 
 def test_column_transformer_callable_specifier():
     # assert that function gets the full array
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_res_first = np.array([[0, 1, 2]]).T
 
     def func(X):
@@ -1241,10 +1272,10 @@ def test_column_transformer_callable_specifier():
 def test_column_transformer_callable_specifier_dataframe():
     # assert that function gets the full dataframe
     pd = pytest.importorskip("pandas")
-    X_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_array = X_ARRAY
     X_res_first = np.array([[0, 1, 2]]).T
 
-    X_df = pd.DataFrame(X_array, columns=["first", "second"])
+    X_df = pd.DataFrame({"first": X_array[:, 0], "second": X_array[:, 1]})
 
     def func(X):
         assert_array_equal(X.columns, X_df.columns)
@@ -1513,7 +1544,7 @@ def test_column_transformer_reordered_column_names_remainder(
     """Test the interaction between remainder and column transformer"""
     pd = pytest.importorskip("pandas")
 
-    X_fit_array = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X_fit_array = X_ARRAY
     X_fit_df = pd.DataFrame(X_fit_array, columns=["first", "second"])
 
     X_trans_array = np.array([[2, 4, 6], [0, 1, 2]]).T
@@ -2124,12 +2155,12 @@ class PandasOutTransformer(BaseEstimator):
         self.offset = offset
 
     def fit(self, X, y=None):
-        pd = pytest.importorskip("pandas")
+        # tests using this transformer skip without pandas, so the module
+        # level `pd` is guaranteed to be available here
         assert isinstance(X, pd.DataFrame)
         return self
 
     def transform(self, X, y=None):
-        pd = pytest.importorskip("pandas")
         assert isinstance(X, pd.DataFrame)
         return X - self.offset
 
@@ -2328,7 +2359,7 @@ def test_routing_passed_metadata_not_supported(method):
     """Test that the right error message is raised when metadata is passed while
     not supported when `enable_metadata_routing=False`."""
 
-    X = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X = X_ARRAY
     y = [1, 2, 3]
     trs = ColumnTransformer([("trans", Trans(), [0])]).fit(X, y)
 
@@ -2342,7 +2373,7 @@ def test_routing_passed_metadata_not_supported(method):
 @pytest.mark.parametrize("method", ["transform", "fit_transform", "fit"])
 def test_metadata_routing_for_column_transformer(method):
     """Test that metadata is routed correctly for column transformer."""
-    X = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X = X_ARRAY
     y = [1, 2, 3]
     registry = _Registry()
     sample_weight, metadata = [1], "a"
@@ -2387,7 +2418,7 @@ def test_metadata_routing_no_fit_transform():
             assert metadata
             return X
 
-    X = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X = X_ARRAY
     y = [1, 2, 3]
     _Registry()
     sample_weight, metadata = [1], "a"
@@ -2411,7 +2442,7 @@ def test_metadata_routing_no_fit_transform():
 @pytest.mark.parametrize("method", ["transform", "fit_transform", "fit"])
 def test_metadata_routing_error_for_column_transformer(method):
     """Test that the right error is raised when metadata is not requested."""
-    X = np.array([[0, 1, 2], [2, 4, 6]]).T
+    X = X_ARRAY
     y = [1, 2, 3]
     sample_weight, metadata = [1], "a"
     trs = ColumnTransformer([("trans", ConsumingTransformer(), [0])])
@@ -1082,7 +1082,8 @@ class GenericUnivariateSelect(_BaseFilter):
 
         # Now perform some acrobatics to set the right named parameter in
         # the selector
-        possible_params = selector._get_param_names()
+        # copy before removing: `_get_param_names` returns a cached list
+        possible_params = list(selector._get_param_names())
         possible_params.remove("score_func")
         selector.set_params(**{possible_params[0]: self.param})
 
@@ -6,6 +6,12 @@ from ..utils import check_matplotlib_support
 from ..utils._plotting import _interval_max_min_ratio, _validate_score_name
 from ._validation import learning_curve, validation_curve
 
+# Default `train_sizes` for `LearningCurveDisplay.from_estimator`. Defaults are
+# evaluated once at definition time, so make the shared array read-only to
+# guard against accidental in-place mutation across calls.
+_DEFAULT_TRAIN_SIZES = np.linspace(0.1, 1.0, 5)
+_DEFAULT_TRAIN_SIZES.setflags(write=False)
+
 
 class _BaseCurveDisplay:
     def _plot_curve(
@@ -53,17 +59,27 @@ class _BaseCurveDisplay:
         else:  # score_type == "both"
             scores = {"Train": train_scores, "Test": test_scores}
 
+        # The mean (and std where needed) of each score is used by several of
+        # the plotting calls below; reduce each score array only once.
+        scores_mean = {
+            line_label: score.mean(axis=1) for line_label, score in scores.items()
+        }
+        if std_display_style in ("errorbar", "fill_between"):
+            scores_std = {
+                line_label: score.std(axis=1) for line_label, score in scores.items()
+            }
+
         if std_display_style in ("fill_between", None):
             # plot the mean score
             if line_kw is None:
                 line_kw = {}
 
             self.lines_ = []
-            for line_label, score in scores.items():
+            for line_label, mean_score in scores_mean.items():
                 self.lines_.append(
                     *ax.plot(
                         x_data,
-                        score.mean(axis=1),
+                        mean_score,
                         label=line_label,
                         **line_kw,
                     )
@@ -76,12 +92,12 @@ class _BaseCurveDisplay:
                 errorbar_kw = {}
 
             self.errorbar_ = []
-            for line_label, score in scores.items():
+            for line_label in scores:
                 self.errorbar_.append(
                     ax.errorbar(
                         x_data,
-                        score.mean(axis=1),
-                        score.std(axis=1),
+                        scores_mean[line_label],
+                        scores_std[line_label],
                         label=line_label,
                         **errorbar_kw,
                     )
@@ -94,12 +110,14 @@ class _BaseCurveDisplay:
             fill_between_kw = {**default_fill_between_kw, **fill_between_kw}
 
             self.fill_between_ = []
-            for line_label, score in scores.items():
+            for line_label in scores:
+                mean_score = scores_mean[line_label]
+                std_score = scores_std[line_label]
                 self.fill_between_.append(
                     ax.fill_between(
                         x_data,
-                        score.mean(axis=1) - score.std(axis=1),
-                        score.mean(axis=1) + score.std(axis=1),
+                        mean_score - std_score,
+                        mean_score + std_score,
                         **fill_between_kw,
                     )
                 )
@@ -311,7 +329,7 @@ class LearningCurveDisplay(_BaseCurveDisplay):
         y,
         *,
         groups=None,
-        train_sizes=np.linspace(0.1, 1.0, 5),
+        train_sizes=_DEFAULT_TRAIN_SIZES,
         cv=None,
         scoring=None,
         exploit_incremental_learning=False,
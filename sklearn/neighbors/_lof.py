@@ -298,14 +298,23 @@ class LocalOutlierFactor(KNeighborsMixin, OutlierMixin, NeighborsBase):
                 copy=False,
             )
 
+        # Cache the distance of each training sample to its k-th nearest
+        # neighbor as a contiguous 1D array: `_local_reachability_density`
+        # gathers from it for every query, at fit time and at predict time.
+        self._dist_k_fit_ = np.ascontiguousarray(
+            self._distances_fit_X_[:, self.n_neighbors_ - 1]
+        )
+
         self._lrd = self._local_reachability_density(
             self._distances_fit_X_, _neighbors_indices_fit_X_
         )
 
-        # Compute lof score over training samples to define offset_:
-        lrd_ratios_array = (
-            self._lrd[_neighbors_indices_fit_X_] / self._lrd[:, np.newaxis]
-        )
+        # Compute lof score over training samples to define offset_. The
+        # gather owns its memory, so the scaling can happen in place; n
+        # reciprocals followed by n * k multiplies are cheaper than n * k
+        # divisions:
+        lrd_ratios_array = self._lrd[_neighbors_indices_fit_X_]
+        lrd_ratios_array *= (1.0 / self._lrd)[:, np.newaxis]
 
         self.negative_outlier_factor_ = -np.mean(lrd_ratios_array, axis=1)
 
@@ -317,6 +326,13 @@ class LocalOutlierFactor(KNeighborsMixin, OutlierMixin, NeighborsBase):
                 self.negative_outlier_factor_, 100.0 * self.contamination
             )
 
+        # These fitted arrays are only read from now on (kneighbors output
+        # and fancy-indexing gathers are C-contiguous already); freezing them
+        # guards against accidental mutation by downstream code.
+        self._distances_fit_X_.flags.writeable = False
+        self._dist_k_fit_.flags.writeable = False
+        self._lrd.flags.writeable = False
+
         return self
 
     def _check_novelty_predict(self):
@@ -374,11 +390,9 @@ class LocalOutlierFactor(KNeighborsMixin, OutlierMixin, NeighborsBase):
 
         if X is not None:
             X = check_array(X, accept_sparse="csr")
-            is_inlier = np.ones(X.shape[0], dtype=int)
-            is_inlier[self.decision_function(X) < 0] = -1
+            is_inlier = np.where(self.decision_function(X) < 0, -1, 1)
         else:
-            is_inlier = np.ones(self.n_samples_fit_, dtype=int)
-            is_inlier[self.negative_outlier_factor_ < self.offset_] = -1
+            is_inlier = np.where(self.negative_outlier_factor_ < self.offset_, -1, 1)
 
         return is_inlier
 
@@ -478,7 +492,10 @@ class LocalOutlierFactor(KNeighborsMixin, OutlierMixin, NeighborsBase):
             neighbors_indices_X,
         )
 
-        lrd_ratios_array = self._lrd[neighbors_indices_X] / X_lrd[:, np.newaxis]
+        # The gather owns its memory, so the scaling can happen in place,
+        # trading per-element divisions for one reciprocal per query:
+        lrd_ratios_array = self._lrd[neighbors_indices_X]
+        lrd_ratios_array *= (1.0 / X_lrd)[:, np.newaxis]
 
         # as bigger is better:
         return -np.mean(lrd_ratios_array, axis=1)
@@ -504,11 +521,15 @@ class LocalOutlierFactor(KNeighborsMixin, OutlierMixin, NeighborsBase):
         local_reachability_density : ndarray of shape (n_queries,)
             The local reachability density of each sample.
         """
-        dist_k = self._distances_fit_X_[neighbors_indices, self.n_neighbors_ - 1]
-        reach_dist_array = np.maximum(distances_X, dist_k)
-
-        # 1e-10 to avoid `nan' when nb of duplicates > n_neighbors_:
-        return 1.0 / (np.mean(reach_dist_array, axis=1) + 1e-10)
+        dist_k = self._dist_k_fit_[neighbors_indices]
+        # `dist_k` is a freshly allocated gather, so it can be reused as the
+        # output buffer, sparing one (n_queries, n_neighbors) temporary.
+        reach_dist_array = np.maximum(distances_X, dist_k, out=dist_k)
+
+        # Equivalent to 1 / (mean + 1e-10) but with a single division per
+        # query; 1e-10 avoids `nan' when nb of duplicates > n_neighbors_:
+        row_sum = np.add.reduce(reach_dist_array, axis=1)
+        return self.n_neighbors_ / (row_sum + self.n_neighbors_ * 1e-10)
 
     def _more_tags(self):
         return {
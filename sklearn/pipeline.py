@@ -1282,7 +1282,8 @@ def _transform_one(transformer, X, y, weight, params):
     """
     res = transformer.transform(X, **params.transform)
     # if we have a weight for this transformer, multiply output
-    if weight is None:
+    if weight is None or weight == 1:
+        # skip the full-size multiply (and its temporary) for a unit weight
         return res
     return res * weight
 
@@ -1306,7 +1307,7 @@ def _fit_transform_one(
                 X, **params.get("transform", {})
             )
 
-    if weight is None:
+    if weight is None or weight == 1:
         return res, transformer
     return res * weight, transformer
 
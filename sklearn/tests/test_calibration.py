@@ -4,6 +4,7 @@
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
+from scipy.special import expit
 
 from sklearn.base import BaseEstimator, clone
 from sklearn.calibration import (
@@ -51,6 +52,11 @@ from sklearn.utils.fixes import CSR_CONTAINERS
 
 N_SAMPLES = 200
 
+# Several tests draw the same seeded uniform sample weights; draw them once.
+# A prefix slice is identical to a shorter draw from the same seed.
+SAMPLE_WEIGHTS = np.random.RandomState(seed=42).uniform(size=N_SAMPLES)
+SAMPLE_WEIGHTS.flags.writeable = False
+
 
 @pytest.fixture(scope="module")
 def data():
@@ -58,6 +64,15 @@ def data():
     return X, y
 
 
+@pytest.fixture(scope="module")
+def prefit_data():
+    n_samples = 50
+    X, y = make_classification(n_samples=3 * n_samples, n_features=6, random_state=42)
+    sample_weight = SAMPLE_WEIGHTS[: y.size]
+    X -= X.min()  # MultinomialNB only allows positive X
+    return X, y, sample_weight
+
+
 @pytest.mark.parametrize("csr_container", CSR_CONTAINERS)
 @pytest.mark.parametrize("method", ["sigmoid", "isotonic"])
 @pytest.mark.parametrize("ensemble", [True, False])
@@ -65,7 +80,7 @@ def test_calibration(data, method, csr_container, ensemble):
     # Test calibration objects with isotonic and sigmoid
     n_samples = N_SAMPLES // 2
     X, y = data
-    sample_weight = np.random.RandomState(seed=42).uniform(size=y.size)
+    sample_weight = SAMPLE_WEIGHTS[: y.size]
 
     X -= X.min()  # MultinomialNB only allows positive X
 
@@ -152,7 +167,7 @@ def test_sample_weight(data, method, ensemble):
     n_samples = N_SAMPLES // 2
     X, y = data
 
-    sample_weight = np.random.RandomState(seed=42).uniform(size=len(y))
+    sample_weight = SAMPLE_WEIGHTS[: len(y)]
     X_train, y_train, sw_train = X[:n_samples], y[:n_samples], sample_weight[:n_samples]
     X_test = X[n_samples:]
 
@@ -166,8 +181,9 @@ def test_sample_weight(data, method, ensemble):
     calibrated_clf.fit(X_train, y_train)
     probs_without_sw = calibrated_clf.predict_proba(X_test)
 
-    diff = np.linalg.norm(probs_with_sw - probs_without_sw)
-    assert diff > 0.1
+    diff = probs_with_sw - probs_without_sw
+    squared_diff = np.einsum("ij,ij->", diff, diff)
+    assert squared_diff > 0.1**2
 
 
 @pytest.mark.parametrize("method", ["sigmoid", "isotonic"])
@@ -286,13 +302,12 @@ def test_calibration_zero_probability():
 
 
 @pytest.mark.parametrize("csr_container", CSR_CONTAINERS)
-def test_calibration_prefit(csr_container):
+@pytest.mark.parametrize("method", ["isotonic", "sigmoid"])
+@pytest.mark.parametrize("use_sample_weight", [True, False])
+def test_calibration_prefit(prefit_data, method, csr_container, use_sample_weight):
     """Test calibration for prefitted classifiers"""
     n_samples = 50
-    X, y = make_classification(n_samples=3 * n_samples, n_features=6, random_state=42)
-    sample_weight = np.random.RandomState(seed=42).uniform(size=y.size)
-
-    X -= X.min()  # MultinomialNB only allows positive X
+    X, y, sample_weight = prefit_data
 
     # split train and test
     X_train, y_train, sw_train = X[:n_samples], y[:n_samples], sample_weight[:n_samples]
@@ -318,19 +333,18 @@ def test_calibration_prefit(csr_container):
         (X_calib, X_test),
         (csr_container(X_calib), csr_container(X_test)),
     ]:
-        for method in ["isotonic", "sigmoid"]:
-            cal_clf = CalibratedClassifierCV(clf, method=method, cv="prefit")
+        cal_clf = CalibratedClassifierCV(clf, method=method, cv="prefit")
 
-            for sw in [sw_calib, None]:
-                cal_clf.fit(this_X_calib, y_calib, sample_weight=sw)
-                y_prob = cal_clf.predict_proba(this_X_test)
-                y_pred = cal_clf.predict(this_X_test)
-                prob_pos_cal_clf = y_prob[:, 1]
-                assert_array_equal(y_pred, np.array([0, 1])[np.argmax(y_prob, axis=1)])
+        sw = sw_calib if use_sample_weight else None
+        cal_clf.fit(this_X_calib, y_calib, sample_weight=sw)
+        y_prob = cal_clf.predict_proba(this_X_test)
+        y_pred = cal_clf.predict(this_X_test)
+        prob_pos_cal_clf = y_prob[:, 1]
+        assert_array_equal(y_pred, cal_clf.classes_[np.argmax(y_prob, axis=1)])
 
-                assert brier_score_loss(y_test, prob_pos_clf) > brier_score_loss(
-                    y_test, prob_pos_cal_clf
-                )
+        assert brier_score_loss(y_test, prob_pos_clf) > brier_score_loss(
+            y_test, prob_pos_cal_clf
+        )
 
 
 @pytest.mark.parametrize("method", ["sigmoid", "isotonic"])
@@ -365,7 +379,7 @@ def test_sigmoid_calibration():
     # computed from my python port of the C++ code in LibSVM
     AB_lin_libsvm = np.array([-0.20261354391187855, 0.65236314980010512])
     assert_array_almost_equal(AB_lin_libsvm, _sigmoid_calibration(exF, exY), 3)
-    lin_prob = 1.0 / (1.0 + np.exp(AB_lin_libsvm[0] * exF + AB_lin_libsvm[1]))
+    lin_prob = expit(-(AB_lin_libsvm[0] * exF + AB_lin_libsvm[1]))
     sk_prob = _SigmoidCalibration().fit(exF, exY).predict(exF)
     assert_array_almost_equal(lin_prob, sk_prob, 6)
 
@@ -451,17 +465,23 @@ def test_calibration_less_classes(ensemble):
     )
     cal_clf.fit(X, y)
 
-    for i, calibrated_classifier in enumerate(cal_clf.calibrated_classifiers_):
-        proba = calibrated_classifier.predict_proba(X)
-        if ensemble:
-            # Check that the unobserved class has proba=0
-            assert_array_equal(proba[:, i], np.zeros(len(y)))
-            # Check for all other classes proba>0
-            assert np.all(proba[:, :i] > 0)
-            assert np.all(proba[:, i + 1 :] > 0)
-        else:
-            # Check `proba` are all 1/n_classes
-            assert np.allclose(proba, 1 / proba.shape[0])
+    probas = np.stack(
+        [
+            calibrated_classifier.predict_proba(X)
+            for calibrated_classifier in cal_clf.calibrated_classifiers_
+        ]
+    )
+    if ensemble:
+        # Check that the class left out of each LOO fold has proba=0
+        fold_idx = np.arange(len(cal_clf.calibrated_classifiers_))
+        assert_array_equal(probas[fold_idx, :, fold_idx], 0)
+        # Check for all other classes proba>0
+        observed = np.ones(probas.shape, dtype=bool)
+        observed[fold_idx, :, fold_idx] = False
+        assert np.all(probas[observed] > 0)
+    else:
+        # Check `probas` are all 1/n_classes
+        assert np.allclose(probas, 1 / probas.shape[-1])
 
 
 @pytest.mark.parametrize(
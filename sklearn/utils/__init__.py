@@ -235,6 +235,20 @@ def _polars_indexing(X, key, key_dtype, axis):
         return X[key]
 
 
+# Mappings used by `_determine_key_type`, built once at import time so that
+# the hot `isinstance` checks do not rebuild a type tuple on every call.
+_key_dtype_to_str = {int: "int", str: "str", bool: "bool", np.bool_: "bool"}
+_key_scalar_types = tuple(_key_dtype_to_str)
+_key_array_dtype_to_str = {
+    "i": "int",
+    "u": "int",
+    "b": "bool",
+    "O": "str",
+    "U": "str",
+    "S": "str",
+}
+
+
 def _determine_key_type(key, accept_slice=True):
     """Determine the data type of key.
 
@@ -257,21 +271,11 @@ def _determine_key_type(key, accept_slice=True):
         "allowed"
     )
 
-    dtype_to_str = {int: "int", str: "str", bool: "bool", np.bool_: "bool"}
-    array_dtype_to_str = {
-        "i": "int",
-        "u": "int",
-        "b": "bool",
-        "O": "str",
-        "U": "str",
-        "S": "str",
-    }
-
     if key is None:
         return None
-    if isinstance(key, tuple(dtype_to_str.keys())):
+    if isinstance(key, _key_scalar_types):
         try:
-            return dtype_to_str[type(key)]
+            return _key_dtype_to_str[type(key)]
         except KeyError:
             raise ValueError(err_msg)
     if isinstance(key, slice):
@@ -299,7 +303,7 @@ def _determine_key_type(key, accept_slice=True):
         return key_type.pop()
     if hasattr(key, "dtype"):
         try:
-            return array_dtype_to_str[key.dtype.kind]
+            return _key_array_dtype_to_str[key.dtype.kind]
         except KeyError:
             raise ValueError(err_msg)
     raise ValueError(err_msg)
@@ -462,15 +466,10 @@ def _get_column_indices(X, key):
         if isinstance(key, str):
             columns = [key]
         elif isinstance(key, slice):
-            start, stop = key.start, key.stop
-            if start is not None:
-                start = all_columns.get_loc(start)
-            if stop is not None:
-                # pandas indexing with strings is endpoint included
-                stop = all_columns.get_loc(stop) + 1
-            else:
-                stop = n_columns + 1
-            return list(islice(range(n_columns), start, stop))
+            # resolve both label bounds in one call; pandas indexing with
+            # strings is endpoint included, which slice_indexer honors
+            idx = all_columns.slice_indexer(key.start, key.stop, key.step)
+            return list(range(n_columns)[idx])
         else:
             columns = list(key)
 
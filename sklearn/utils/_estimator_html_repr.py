@@ -5,7 +5,7 @@ from io import StringIO
 from pathlib import Path
 from string import Template
 
-from .. import __version__, config_context
+from .. import __version__, config_context, get_config
 from .fixes import parse_version
 
 
@@ -14,11 +14,12 @@ class _IDCounter:
 
     def __init__(self, prefix):
         self.prefix = prefix
+        self._prefix_dash = prefix + "-"
         self.count = 0
 
     def get_id(self):
         self.count += 1
-        return f"{self.prefix}-{self.count}"
+        return self._prefix_dash + str(self.count)
 
 
 def _get_css_style():
@@ -28,6 +29,8 @@ def _get_css_style():
 _CONTAINER_ID_COUNTER = _IDCounter("sk-container-id")
 _ESTIMATOR_ID_COUNTER = _IDCounter("sk-estimator-id")
 _CSS_STYLE = _get_css_style()
+# parse the style template once; only the container id varies between calls
+_CSS_STYLE_TEMPLATE = Template(_CSS_STYLE)
 
 
 class _VisualBlock:
@@ -187,17 +190,15 @@ def _get_visual_block(estimator):
 
     # check if estimator looks like a meta estimator (wraps estimators)
     if hasattr(estimator, "get_params") and not isclass(estimator):
-        estimators = [
-            (key, est)
-            for key, est in estimator.get_params(deep=False).items()
-            if hasattr(est, "get_params") and hasattr(est, "fit") and not isclass(est)
-        ]
+        estimators, names, name_details = [], [], []
+        for key, est in estimator.get_params(deep=False).items():
+            if hasattr(est, "get_params") and hasattr(est, "fit") and not isclass(est):
+                estimators.append(est)
+                names.append(f"{key}: {est.__class__.__name__}")
+                name_details.append(str(est))
         if estimators:
             return _VisualBlock(
-                "parallel",
-                [est for _, est in estimators],
-                names=[f"{key}: {est.__class__.__name__}" for key, est in estimators],
-                name_details=[str(est) for _, est in estimators],
+                "parallel", estimators, names=names, name_details=name_details
             )
 
     return _VisualBlock(
@@ -251,8 +252,12 @@ def _write_estimator_html(
         est_block = _get_visual_block(estimator)
     else:
         is_fitted_icon = ""
-        with config_context(print_changed_only=True):
+        if get_config()["print_changed_only"]:
+            # the default configuration; no need to push a config context
             est_block = _get_visual_block(estimator)
+        else:
+            with config_context(print_changed_only=True):
+                est_block = _get_visual_block(estimator)
     # `estimator` can also be an instance of `_VisualBlock`
     if hasattr(estimator, "_get_doc_link"):
         doc_link = estimator._get_doc_link()
@@ -287,17 +292,27 @@ def _write_estimator_html(
                     is_fitted_css_class=is_fitted_css_class,
                 )
             else:  # parallel
-                out.write('<div class="sk-parallel-item">')
-                # wrap element in a serial visualblock
-                serial_block = _VisualBlock("serial", [est], dash_wrapped=False)
+                # emit the markup of a one-element serial block wrapping
+                # `est` directly, instead of allocating a `_VisualBlock` and
+                # recursing through it
+                out.write('<div class="sk-parallel-item"><div class="sk-item">')
+                if name:
+                    _write_label_html(
+                        out,
+                        name,
+                        name_details,
+                        is_fitted_css_class=is_fitted_css_class,
+                    )
+                out.write('<div class="sk-serial">')
                 _write_estimator_html(
                     out,
-                    serial_block,
-                    name,
-                    name_details,
+                    est,
+                    None,
+                    None,
                     is_fitted_css_class=is_fitted_css_class,
                 )
-                out.write("</div>")  # sk-parallel-item
+                # sk-serial, sk-item and sk-parallel-item
+                out.write("</div></div></div>")
 
         out.write("</div></div>")
     elif est_block.kind == "single":
@@ -350,8 +365,7 @@ def estimator_html_repr(estimator):
     )
     with closing(StringIO()) as out:
         container_id = _CONTAINER_ID_COUNTER.get_id()
-        style_template = Template(_CSS_STYLE)
-        style_with_id = style_template.substitute(id=container_id)
+        style_with_id = _CSS_STYLE_TEMPLATE.substitute(id=container_id)
         estimator_str = str(estimator)
 
         # The fallback message is shown by default and loading the CSS sets
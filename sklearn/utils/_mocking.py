@@ -50,7 +50,7 @@ class MockDataFrame:
         return MockDataFrame(self.array == other.array)
 
     def __ne__(self, other):
-        return not self == other
+        return MockDataFrame(self.array != other.array)
 
     def take(self, indices, axis=0):
         return MockDataFrame(self.array.take(indices, axis=axis))
@@ -243,7 +243,7 @@ class CheckingClassifier(ClassifierMixin, BaseEstimator):
         """
         if self.methods_to_check == "all" or "predict" in self.methods_to_check:
             X, y = self._check_X_y(X)
-        return self.classes_[np.zeros(_num_samples(X), dtype=int)]
+        return np.full(_num_samples(X), self.classes_[0])
 
     def predict_proba(self, X):
         """Predict probabilities for each class.